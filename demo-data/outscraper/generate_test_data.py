@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 """
 Generate test Outscraper JSON files with mixed reviews to trigger recommendations.
+
+The module is fully annotated so it can be compiled ahead of time with
+`mypyc generate_test_data.py`. The compiled extension shadows this file on
+import, so run it with `python -c "import generate_test_data as g; g.main()"`.
 """
 
+import argparse
 import json
+import os
 import random
 import hashlib
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Any, BinaryIO, Iterable, Iterator, Sequence, TypeVar
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
 
 # Restaurant configurations
-RESTAURANTS = [
+RESTAURANTS: list[dict[str, Any]] = [
     {
         "name": "Bella Notte Italian",
         "filename": "test-bella-notte-italian.json",
@@ -143,6 +156,41 @@ NEGATIVE_REVIEWS = {
     ],
 }
 
+# Small lookup tables are indexed with one 3-bit getrandbits draw, rejecting
+# out-of-range values so every entry stays equally likely
+_TABLE_BITS = 3
+
+T = TypeVar("T")
+
+
+def _table(name: str, items: Sequence[T]) -> tuple[T, ...]:
+    """Freeze items into a lookup table for _pick, checking it fits in _TABLE_BITS."""
+    if not 0 < len(items) <= 1 << _TABLE_BITS:
+        raise ValueError(f"{name} must have 1-{1 << _TABLE_BITS} entries, got {len(items)}")
+    return tuple(items)
+
+
+def _pick(table: tuple[T, ...]) -> T:
+    """Pick a uniformly random entry from a table built by _table."""
+    n = len(table)
+    while (i := random.getrandbits(_TABLE_BITS)) >= n:
+        pass
+    return table[i]
+
+
+# Templates pre-split on "{dish}" so a review is rendered with dish.join(parts)
+_POSITIVE_PARTS = {
+    theme: _table(f"POSITIVE_REVIEWS[{theme!r}]", [t.split("{dish}") for t in templates])
+    for theme, templates in POSITIVE_REVIEWS.items()
+}
+_NEGATIVE_PARTS = {
+    theme: _table(f"NEGATIVE_REVIEWS[{theme!r}]", [t.split("{dish}") for t in templates])
+    for theme, templates in NEGATIVE_REVIEWS.items()
+}
+
+_POS_THEMES = tuple(POSITIVE_REVIEWS.keys())
+_NEG_THEMES = _table("NEGATIVE_REVIEWS", tuple(NEGATIVE_REVIEWS.keys()))
+
 NEUTRAL_REVIEWS = [
     "It was okay. Nothing special but not bad either.",
     "Average experience overall. Food was decent.",
@@ -161,6 +209,10 @@ DISHES = {
     "Indian Restaurant": ["butter chicken", "lamb curry", "biryani", "tikka masala", "naan bread", "samosas"],
 }
 
+_NEUTRAL_TABLE = _table("NEUTRAL_REVIEWS", NEUTRAL_REVIEWS)
+_DISH_TABLES = {category: _table(f"DISHES[{category!r}]", dishes) for category, dishes in DISHES.items()}
+_DEFAULT_DISHES = _table("default dishes", ["signature dish"])
+
 AUTHOR_NAMES = [
     "John", "Sarah", "Mike", "Emma", "David", "Lisa", "James", "Anna", "Chris", "Kate",
     "Tom", "Jessica", "Daniel", "Sophie", "Andrew", "Rachel", "Mark", "Emily", "Paul", "Amy",
@@ -171,152 +223,256 @@ AUTHOR_NAMES = [
 ]
 
 
-def generate_review_id():
-    """Generate a realistic-looking review ID."""
-    chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
-    return "Ci9DQUF" + "".join(random.choices(chars, k=50))
+ID_PREFIX = "Ci9DQUF"
+ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+ID_LENGTH = 50
+# author_image and review_link only carry a truncated ID (20 and 30 chars with prefix)
+IMAGE_ID_LENGTH = 20 - len(ID_PREFIX)
+LINK_ID_LENGTH = 30 - len(ID_PREFIX)
+
+AUTHOR_ID_LENGTH = 18
+
+# review_questions answer bins and like counts
+_PRICE_BINS = ("R 100–200", "R 200–300", "R 300–400", "R 400–500")
+_NOISE_BINS = ("Quiet", "Moderate noise", "Lively")
+_WAIT_BINS = ("No wait", "0–10 min", "10–20 min", "20–30 min", "More than 30 min")
+_LIKES = (None, 0, 1, 2, 3)
+
+# Owner reply to a negative review, wrapped around the reviewer's name
+_OWNER_PRE = "Thank you for your feedback, "
+_OWNER_POST = ". We're sorry to hear about your experience and are working to improve."
+
+
+class _IdPool:
+    """Hand out random characters from a lazily refilled block.
+
+    Drawing one large block and slicing it amortises the per-ID call and join
+    overhead across thousands of IDs. Blocks are built from os.urandom (one
+    getrandom call) mapped onto the alphabet through a translate table,
+    dropping the top bytes that would bias the modulo.
+    """
+
+    def __init__(self, alphabet: str, block_size: int = 500_000) -> None:
+        self.block_size = block_size
+        self.table = "".join(alphabet[b % len(alphabet)] for b in range(256)).encode("ascii")
+        self.reject = bytes(range(256 - 256 % len(alphabet), 256))
+        self.block = ""
+        self.pos = 0
+
+    def _refill(self, k: int) -> None:
+        need = max(k, self.block_size)
+        fresh = b""
+        while len(fresh) < need:
+            # Over-draw slightly so the rejected bytes rarely force a second pass
+            fresh += os.urandom(need + need // 16).translate(self.table, self.reject)
+        self.block = self.block[self.pos:] + fresh.decode("ascii")
+        self.pos = 0
+
+    def take(self, k: int) -> str:
+        """Return the next k random characters."""
+        if self.pos + k > len(self.block):
+            self._refill(k)
+        start = self.pos
+        self.pos += k
+        return self.block[start:self.pos]
+
+
+_ID_POOL = _IdPool(ID_CHARS)
+_LEADING_DIGIT_POOL = _IdPool("123456789", block_size=10_000)
+_DIGIT_POOL = _IdPool("0123456789", block_size=100_000)
+
+
+def generate_author_ids(n: int) -> list[str]:
+    """Generate n numeric author IDs as 18-digit strings."""
+    rest = AUTHOR_ID_LENGTH - 1
+    leading = _LEADING_DIGIT_POOL.take(n)
+    digits = _DIGIT_POOL.take(n * rest)
+    return [lead + digits[i * rest:(i + 1) * rest] for i, lead in enumerate(leading)]
 
 
-def generate_author_id():
-    """Generate a numeric author ID."""
-    return str(random.randint(100000000000000000, 999999999999999999))
+def generate_timestamps(now_ts: int, n: int, days_back_max: int = 365) -> list[int]:
+    """Generate n timestamps within the last year, counting back from now_ts."""
+    offsets = random.choices(range(86400, (days_back_max + 1) * 86400), k=n)
+    return [now_ts - offset for offset in offsets]
 
 
-def generate_timestamp(days_back_max=365):
-    """Generate a timestamp within the last year."""
-    days_back = random.randint(1, days_back_max)
-    dt = datetime.now() - timedelta(days=days_back, hours=random.randint(0, 23), minutes=random.randint(0, 59))
-    return int(dt.timestamp())
+def _sample_themes(themes: tuple[str, ...], k: int) -> list[str]:
+    """Pick k distinct themes by rejection, which beats random.sample for tiny k."""
+    n = len(themes)
+    picked = [themes[random.randrange(n)]]
+    while len(picked) < k:
+        theme = themes[random.randrange(n)]
+        if theme not in picked:
+            picked.append(theme)
+    return picked
 
 
-def generate_review(rating, restaurant, issues):
-    """Generate a single review with appropriate content for the rating."""
-    dishes = DISHES.get(restaurant["category"], ["signature dish"])
-    dish = random.choice(dishes)
+def generate_review_text(rating: int, issues: list[str], dishes: tuple[str, ...]) -> str:
+    """Generate review text with appropriate content for the rating.
+
+    dishes is a lookup table from _DISH_TABLES.
+    """
+    dish = _pick(dishes)
     
     # Determine what kind of review to generate
     if rating >= 4:
         # Positive review - pick random positive themes
-        themes = random.sample(list(POSITIVE_REVIEWS.keys()), k=random.randint(1, 3))
-        parts = []
-        for theme in themes:
-            template = random.choice(POSITIVE_REVIEWS[theme])
-            parts.append(template.format(dish=dish))
-        text = " ".join(parts)
-        food_score = str(random.choice([4, 5]))
-        service_score = str(random.choice([4, 5]))
-        atmosphere_score = str(random.choice([4, 5]))
+        themes = _sample_themes(_POS_THEMES, random.randint(1, 3))
+        text = " ".join([dish.join(_pick(_POSITIVE_PARTS[theme])) for theme in themes])
     elif rating <= 2:
         # Negative review - focus on the restaurant's issues
         if issues and random.random() < 0.7:  # 70% chance to complain about the issue
             theme = random.choice(issues)
-            text = random.choice(NEGATIVE_REVIEWS.get(theme, NEGATIVE_REVIEWS["SERVICE"])).format(dish=dish)
+            text = dish.join(_pick(_NEGATIVE_PARTS.get(theme, _NEGATIVE_PARTS["SERVICE"])))
             # Maybe add another complaint
             if random.random() < 0.4:
-                other_theme = random.choice(list(NEGATIVE_REVIEWS.keys()))
-                text += " " + random.choice(NEGATIVE_REVIEWS[other_theme]).format(dish=dish)
+                other_theme = _pick(_NEG_THEMES)
+                text += " " + dish.join(_pick(_NEGATIVE_PARTS[other_theme]))
         else:
             # Random negative themes
-            themes = random.sample(list(NEGATIVE_REVIEWS.keys()), k=random.randint(1, 2))
-            parts = [random.choice(NEGATIVE_REVIEWS[t]).format(dish=dish) for t in themes]
-            text = " ".join(parts)
-        food_score = str(random.choice([1, 2, 3]))
-        service_score = str(random.choice([1, 2, 3]))
-        atmosphere_score = str(random.choice([1, 2, 3]))
+            themes = _sample_themes(_NEG_THEMES, random.randint(1, 2))
+            text = " ".join([dish.join(_pick(_NEGATIVE_PARTS[t])) for t in themes])
     else:
         # Neutral review (3 stars)
-        text = random.choice(NEUTRAL_REVIEWS)
+        text = _pick(_NEUTRAL_TABLE)
         if random.random() < 0.5:
             # Add some specifics
             if issues and random.random() < 0.5:
                 theme = random.choice(issues)
-                text += " " + random.choice(NEGATIVE_REVIEWS.get(theme, NEGATIVE_REVIEWS["SERVICE"])).format(dish=dish)
+                text += " " + dish.join(_pick(_NEGATIVE_PARTS.get(theme, _NEGATIVE_PARTS["SERVICE"])))
             else:
                 text += f" The {dish} was decent."
-        food_score = str(random.choice([3, 4]))
-        service_score = str(random.choice([2, 3, 4]))
-        atmosphere_score = str(random.choice([3, 4]))
+    return text
+
+
+def draw_scores(ratings: list[int], high: tuple[str, ...], mid: tuple[str, ...], low: tuple[str, ...]) -> list[str]:
+    """Draw one sub-score column, taking each row from the choices for its rating band."""
+    n = len(ratings)
+    high_col = random.choices(high, k=n)
+    mid_col = random.choices(mid, k=n)
+    low_col = random.choices(low, k=n)
+    return [h if r >= 4 else lo if r <= 2 else m for r, h, m, lo in zip(ratings, high_col, mid_col, low_col)]
+
+
+def generate_reviews_bulk(restaurant: dict[str, Any], ratings: list[int], now_ts: int) -> Iterator[dict[str, Any]]:
+    """Yield one review per rating, drawing every numeric and choice column up front."""
+    n = len(ratings)
+    issues = restaurant["issues"]
+    dishes = _DISH_TABLES.get(restaurant["category"], _DEFAULT_DISHES)
+    google_id = restaurant["place_id"]
     
-    author_name = random.choice(AUTHOR_NAMES)
-    timestamp = generate_timestamp()
+    # Draw every review's four character IDs as one block and slice it up
+    stride = 2 * ID_LENGTH + IMAGE_ID_LENGTH + LINK_ID_LENGTH
+    id_block = _ID_POOL.take(n * stride)
+    offsets = range(0, n * stride, stride)
+    review_ids = [ID_PREFIX + id_block[o:o + ID_LENGTH] for o in offsets]
+    pagination_ids = [ID_PREFIX + id_block[o + ID_LENGTH:o + 2 * ID_LENGTH] for o in offsets]
+    image_ids = [ID_PREFIX + id_block[o + 2 * ID_LENGTH:o + 2 * ID_LENGTH + IMAGE_ID_LENGTH] for o in offsets]
+    link_ids = [ID_PREFIX + id_block[o + stride - LINK_ID_LENGTH:o + stride] for o in offsets]
+    author_link_ids = generate_author_ids(n)
+    author_ids = generate_author_ids(n)
     
-    # Maybe add owner response for negative reviews
-    owner_answer = None
-    owner_answer_timestamp = None
-    if rating <= 2 and random.random() < 0.3:
-        owner_answer = f"Thank you for your feedback, {author_name}. We're sorry to hear about your experience and are working to improve."
-        owner_answer_timestamp = timestamp + random.randint(86400, 604800)  # 1-7 days later
+    texts = [generate_review_text(rating, issues, dishes) for rating in ratings]
+    food_scores = draw_scores(ratings, ("4", "5"), ("3", "4"), ("1", "2", "3"))
+    service_scores = draw_scores(ratings, ("4", "5"), ("2", "3", "4"), ("1", "2", "3"))
+    atmosphere_scores = draw_scores(ratings, ("4", "5"), ("3", "4"), ("1", "2", "3"))
+    authors = random.choices(AUTHOR_NAMES, k=n)
+    timestamps = generate_timestamps(now_ts, n)
+    reviews_counts = random.choices(range(1, 201), k=n)
+    ratings_counts = random.choices(range(0, 51), k=n)
+    prices = random.choices(_PRICE_BINS, k=n)
+    noise_levels = random.choices(_NOISE_BINS, k=n)
+    wait_times = random.choices(_WAIT_BINS, k=n)
+    likes = random.choices(_LIKES, k=n)
+    answered = random.choices((True, False), weights=(3, 7), k=n)  # 30% of negative reviews get a reply
+    answer_delays = random.choices(range(86400, 604801), k=n)  # 1-7 days later
     
-    return {
-        "google_id": restaurant["place_id"],
-        "review_id": generate_review_id(),
-        "review_pagination_id": generate_review_id(),
-        "author_link": f"https://www.google.com/maps/contrib/{generate_author_id()}?hl=en",
-        "author_title": author_name,
-        "author_id": generate_author_id(),
-        "author_image": f"https://lh3.googleusercontent.com/a-/ALV-{generate_review_id()[:20]}=s120-c-rp-mo-ba4-br100",
-        "author_reviews_count": random.randint(1, 200),
-        "author_ratings_count": random.randint(0, 50),
-        "review_text": text,
-        "review_img_urls": None,
-        "review_img_url": None,
-        "review_questions": {
-            "Price per person": random.choice(["R 100–200", "R 200–300", "R 300–400", "R 400–500"]),
-            "Food": food_score,
-            "Service": service_score,
-            "Atmosphere": atmosphere_score,
-            "Noise level": random.choice(["Quiet", "Moderate noise", "Lively"]),
-            "Special events": "No special event",
-            "Wait time": random.choice(["No wait", "0–10 min", "10–20 min", "20–30 min", "More than 30 min"]),
-        },
-        "review_photo_ids": None,
-        "owner_answer": owner_answer,
-        "owner_answer_timestamp": owner_answer_timestamp,
-        "owner_answer_timestamp_datetime_utc": None,
-        "review_link": f"https://www.google.com/maps/reviews/data=!4m8!14m7!1m6!2m5!1s{generate_review_id()[:30]}",
-        "review_rating": rating,
-        "review_timestamp": timestamp,
-        "review_datetime_utc": datetime.fromtimestamp(timestamp).strftime("%m/%d/%Y %H:%M:%S"),
-        "review_likes": random.choice([None, 0, 1, 2, 3]) if rating >= 4 else None,
-        "reviews_id": str(random.randint(-9999999999999999999, 9999999999999999999)),
-    }
+    for (rating, text, food_score, service_score, atmosphere_score, author_name, timestamp,
+         reviews_count, ratings_count, price, noise, wait, like, has_answer, answer_delay,
+         review_id, pagination_id, image_id, link_id, author_link_id, author_id) in zip(
+            ratings, texts, food_scores, service_scores, atmosphere_scores, authors, timestamps,
+            reviews_counts, ratings_counts, prices, noise_levels, wait_times, likes, answered, answer_delays,
+            review_ids, pagination_ids, image_ids, link_ids, author_link_ids, author_ids):
+        # Maybe add owner response for negative reviews
+        owner_answer: str | None = None
+        owner_answer_timestamp: int | None = None
+        if rating <= 2 and has_answer:
+            owner_answer = _OWNER_PRE + author_name + _OWNER_POST
+            owner_answer_timestamp = timestamp + answer_delay
+        
+        # Resolve every derived value first so the dict literal only reads locals
+        author_link = f"https://www.google.com/maps/contrib/{author_link_id}?hl=en"
+        author_image = f"https://lh3.googleusercontent.com/a-/ALV-{image_id}=s120-c-rp-mo-ba4-br100"
+        review_link = f"https://www.google.com/maps/reviews/data=!4m8!14m7!1m6!2m5!1s{link_id}"
+        review_datetime = time.strftime("%m/%d/%Y %H:%M:%S", time.gmtime(timestamp))
+        review_likes = like if rating >= 4 else None
+        reviews_id = str(random.randint(-9999999999999999999, 9999999999999999999))
+        
+        yield {
+            "google_id": google_id,
+            "review_id": review_id,
+            "review_pagination_id": pagination_id,
+            "author_link": author_link,
+            "author_title": author_name,
+            "author_id": author_id,
+            "author_image": author_image,
+            "author_reviews_count": reviews_count,
+            "author_ratings_count": ratings_count,
+            "review_text": text,
+            "review_img_urls": None,
+            "review_img_url": None,
+            "review_questions": {
+                "Price per person": price,
+                "Food": food_score,
+                "Service": service_score,
+                "Atmosphere": atmosphere_score,
+                "Noise level": noise,
+                "Special events": "No special event",
+                "Wait time": wait,
+            },
+            "review_photo_ids": None,
+            "owner_answer": owner_answer,
+            "owner_answer_timestamp": owner_answer_timestamp,
+            "owner_answer_timestamp_datetime_utc": None,
+            "review_link": review_link,
+            "review_rating": rating,
+            "review_timestamp": timestamp,
+            "review_datetime_utc": review_datetime,
+            "review_likes": review_likes,
+            "reviews_id": reviews_id,
+        }
 
 
-def generate_restaurant_data(restaurant, num_reviews=500):
-    """Generate complete restaurant data with reviews."""
-    # Generate ratings based on distribution
-    ratings = []
-    for rating, percentage in restaurant["rating_dist"].items():
-        count = int(num_reviews * percentage / 100)
-        ratings.extend([int(rating)] * count)
+def generate_ratings(restaurant: dict[str, Any], num_reviews: int = 500) -> list[int]:
+    """Generate a shuffled list of ratings following the restaurant's distribution."""
+    counts = {int(rating): int(num_reviews * percentage / 100) for rating, percentage in restaurant["rating_dist"].items()}
+    ratings = list(chain.from_iterable(repeat(rating, count) for rating, count in counts.items()))
     
     # Fill any remaining
-    while len(ratings) < num_reviews:
-        ratings.append(random.randint(1, 5))
+    ratings += random.choices(range(1, 6), k=num_reviews - len(ratings))
     
     random.shuffle(ratings)
-    
-    # Generate reviews
-    reviews = []
-    for rating in ratings:
-        review = generate_review(rating, restaurant, restaurant["issues"])
-        reviews.append(review)
-    
+    return ratings
+
+
+def generate_place_data(restaurant: dict[str, Any], ratings: list[int]) -> dict[str, Any]:
+    """Build the place fields for a restaurant, everything except reviews_data."""
     # Calculate average rating
     avg_rating = sum(ratings) / len(ratings)
     
-    # Build place data
-    place_data = {
+    address_parts = [part.strip() for part in restaurant["address"].split(",")]
+    name_slug = restaurant["name"].lower().replace(" ", "")
+    return {
         "query": restaurant["name"],
         "name": restaurant["name"],
-        "name_for_emails": restaurant["name"].lower().replace(" ", ""),
+        "name_for_emails": name_slug,
         "place_id": restaurant["place_id"],
         "google_id": restaurant["place_id"],
         "kgmid": f"/g/test_{restaurant['place_id'][-10:]}",
         "full_address": restaurant["address"],
         "borough": None,
-        "street": restaurant["address"].split(",")[0],
-        "postal_code": restaurant["address"].split(",")[-1].strip().split()[-1],
+        "street": address_parts[0],
+        "postal_code": address_parts[-1].split()[-1],
         "area_service": None,
         "country_code": "ZA",
         "country": "South Africa",
@@ -328,35 +484,82 @@ def generate_restaurant_data(restaurant, num_reviews=500):
         "longitude": round(18.4 + random.random() * 0.2, 6),
         "h3": None,
         "time_zone": "Africa/Johannesburg",
-        "site": f"https://www.{restaurant['name'].lower().replace(' ', '')}.co.za",
+        "site": f"https://www.{name_slug}.co.za",
         "phone": f"+27 {random.randint(10, 99)} {random.randint(100, 999)} {random.randint(1000, 9999)}",
         "type": restaurant["category"],
         "category": restaurant["category"],
         "subtypes": restaurant["category"],
         "rating": round(avg_rating, 1),
-        "reviews": num_reviews,
-        "reviews_data": reviews,
+        "reviews": len(ratings),
     }
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """Encode data as compact (or indented) UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_place_json(
+    f: BinaryIO, place_data: dict[str, Any], reviews: Iterable[dict[str, Any]], pretty: bool = False
+) -> None:
+    """Write place_data plus reviews_data to a binary file, encoding one review at a time.
+
+    The output matches dumps_json of the combined dict, but the reviews never
+    need to be held in memory (or serialised) as a whole.
+    """
+    head = dumps_json(place_data, pretty=pretty)
+    if pretty:
+        # Splice the array in before the closing "\n}" and indent each review two levels
+        f.write(head[:-2] + b',\n  "reviews_data": [')
+        separator = b"\n    "
+        for review in reviews:
+            f.write(separator + dumps_json(review, pretty=True).replace(b"\n", b"\n    "))
+            separator = b",\n    "
+        # The encoder writes an empty array as "[]" rather than breaking the line
+        f.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
+    else:
+        f.write(head[:-1] + b',"reviews_data":[')
+        separator = b""
+        for review in reviews:
+            f.write(separator + dumps_json(review))
+            separator = b","
+        f.write(b"]}")
+
+
+def _process_restaurant(restaurant: dict[str, Any], pretty: bool = False) -> str:
+    """Generate and write one restaurant's file, returning its summary lines."""
+    # Forked workers inherit the parent's RNG state, so give each its own stream
+    random.seed(os.getpid() ^ time.time_ns())
+    ratings = generate_ratings(restaurant, num_reviews=500)
+    place_data = generate_place_data(restaurant, ratings)
+    reviews = generate_reviews_bulk(restaurant, ratings, int(time.time()))
+    
+    filepath = f"/Users/edward/Code/PickdSpec/demo-data/outscraper/{restaurant['filename']}"
+    with open(filepath, "wb", buffering=1 << 20) as f:
+        write_place_json(f, place_data, reviews, pretty=pretty)
     
-    return place_data
+    return (
+        f"  Created {restaurant['name']} ({restaurant['filename']})\n"
+        f"    - {len(ratings)} reviews, avg rating: {sum(ratings)/len(ratings):.2f}\n"
+        f"    - Issues targeted: {restaurant['issues']}"
+    )
 
 
-def main():
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate test Outscraper JSON files.")
+    parser.add_argument("--pretty", action="store_true", help="indent the JSON output for debugging")
+    args = parser.parse_args()
+    
     print("Generating test restaurant data...")
     
-    for restaurant in RESTAURANTS:
-        print(f"  Creating {restaurant['name']} ({restaurant['filename']})...")
-        data = generate_restaurant_data(restaurant, num_reviews=500)
-        
-        filepath = f"/Users/edward/Code/PickdSpec/demo-data/outscraper/{restaurant['filename']}"
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
-        
-        # Print summary
-        reviews = data["reviews_data"]
-        ratings = [r["review_rating"] for r in reviews]
-        print(f"    - {len(reviews)} reviews, avg rating: {sum(ratings)/len(ratings):.2f}")
-        print(f"    - Issues targeted: {restaurant['issues']}")
+    # Restaurants are independent, so generate them in parallel
+    with ProcessPoolExecutor() as executor:
+        for summary in executor.map(_process_restaurant, RESTAURANTS, repeat(args.pretty)):
+            print(summary)
     
     print("\nDone! Created 5 test restaurant files.")
 